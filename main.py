@@ -1,11 +1,16 @@
+import json
 import os
 import sys
 import subprocess
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
-from PySide6.QtCore import QThread, Signal, QUrl
+from functools import partial
+from PySide6.QtCore import QObject, QProcess, QThread, QTimer, Signal, QUrl
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
+    QCheckBox,
     QFileDialog,
     QHBoxLayout,
     QLabel,
@@ -13,89 +18,501 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QProgressBar,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
 
+MAX_PARALLEL_SEGMENTS = 8
+
+
+def _find_executable(env_name: str, candidate_paths: list[str]) -> str | None:
+    env_path = os.environ.get(env_name, "").strip()
+    if env_path and os.path.isfile(env_path) and os.access(env_path, os.X_OK):
+        return env_path
+
+    for candidate in candidate_paths:
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+
+    return None
+
+
+def find_uvx() -> str | None:
+    return _find_executable(
+        "UVX_PATH",
+        [
+            os.path.expanduser("~/.cargo/bin/uvx"),
+            os.path.expanduser("~/.local/bin/uvx"),
+            "/usr/local/bin/uvx",
+            "/opt/homebrew/bin/uvx",
+        ],
+    )
+
+
+def find_ffmpeg() -> str | None:
+    return _find_executable(
+        "FFMPEG_PATH",
+        [
+            os.path.expanduser("~/.local/bin/ffmpeg"),
+            "/usr/local/bin/ffmpeg",
+            "/opt/homebrew/bin/ffmpeg",
+            "/usr/bin/ffmpeg",
+        ],
+    )
+
+
 @dataclass
 class ConvertRequest:
     video_path: str
     output_dir: str
     ffmpeg_path: str
+    frame_stride: int = 1
+    use_gpu: bool = False
+    drop_black_threshold: int = 0
+
+
+@dataclass
+class Interval:
+    """一段按关键帧切分的视频区间，frame_count 为 None 表示直到视频结尾。"""
+
+    start_time: float
+    first_frame: int
+    frame_count: int | None
+
 
+class ConvertWorker(QObject):
+    """在界面线程上通过 QProcess 异步驱动 ffprobe/ffmpeg，不额外占用线程。
+
+    进度写入 progress（-1 表示进度未知，0-100 为百分比），由界面定时读取。
+    """
 
-class ConvertWorker(QThread):
-    progress_changed = Signal(int)
     status_changed = Signal(str)
     finished_ok = Signal(int)
     failed = Signal(str)
 
-    def __init__(self, request: ConvertRequest):
-        super().__init__()
+    def __init__(self, request: ConvertRequest, parent=None):
+        super().__init__(parent)
         self.request = request
-
-    def run(self):
-        try:
-            self._convert_video()
-        except Exception as exc:
-            self.failed.emit(str(exc))
-
-    def _convert_video(self):
+        self.progress = 0
+        self._frame_stride = max(1, request.frame_stride)
+        self._cpu_count = os.cpu_count() or 1
+        self._segment_count = min(self._cpu_count, MAX_PARALLEL_SEGMENTS)
+        if request.drop_black_threshold > 0:
+            # 丢弃黑帧后各段输出帧数无法预知，只能单进程顺序编号
+            self._segment_count = 1
+        self._hwaccel_args = []
+        self._hwaccel_unavailable = False
+        self._stream_copy = False
+        self._probe_output = ""
+        self._probe_stream = {}
+        self._probe_start_time = 0.0
+        self._probe_valid = True
+        self._packet_times = array("d")
+        self._keyframe_times = array("d")
+        self._processes = []
+        self._pending_output = []
+        self._segment_frames = []
+        self._total_frames = 0
+        self._duration = 0.0
+        self._segment_out_times = []
+        self._running = 0
+        self._aborted = False
+
+    def start(self):
         video_path = self.request.video_path
         output_dir = self.request.output_dir
         ffmpeg_path = self.request.ffmpeg_path
 
-        if not os.path.exists(video_path):
-            raise FileNotFoundError("视频文件不存在")
+        try:
+            if not os.path.exists(video_path):
+                raise FileNotFoundError("视频文件不存在")
 
-        os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(output_dir, exist_ok=True)
 
-        if not ffmpeg_path or not os.path.isfile(ffmpeg_path):
-            raise RuntimeError("未找到 ffmpeg，请安装后重试")
+            if not ffmpeg_path or not os.path.isfile(ffmpeg_path):
+                raise RuntimeError("未找到 ffmpeg，请安装后重试")
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
 
-        self.progress_changed.emit(-1)
+        self.progress = -1
         self.status_changed.emit("开始转换...")
+        if self.request.use_gpu:
+            self._run_probe(ffmpeg_path, ["-hide_banner", "-hwaccels"], self._on_hwaccels_probed)
+        else:
+            self._plan()
+
+    def _run_probe(self, program: str, args: list[str], callback):
+        """异步运行探测命令，成功时把 stdout 交给 callback，失败时传入空字符串。"""
+        process = QProcess(self)
+
+        def on_finished(exit_code: int, exit_status: QProcess.ExitStatus):
+            output = bytes(process.readAllStandardOutput()).decode("utf-8", "replace")
+            process.deleteLater()
+            ok = exit_status == QProcess.NormalExit and exit_code == 0
+            callback(output if ok else "")
+
+        def on_error(error: QProcess.ProcessError):
+            if error == QProcess.FailedToStart:
+                process.deleteLater()
+                callback("")
+
+        process.finished.connect(on_finished)
+        process.errorOccurred.connect(on_error)
+        process.start(program, args)
+
+    def _on_hwaccels_probed(self, output: str):
+        if self._parse_hwaccels(output):
+            # auto 在设备初始化失败时会自动回退到 CPU 解码
+            self._hwaccel_args = ["-hwaccel", "auto"]
+        else:
+            self._hwaccel_unavailable = True
+        self._plan()
+
+    def _plan(self):
+        ffprobe_path = self._find_ffprobe()
+        if not ffprobe_path:
+            self._start_segments([Interval(0.0, 0, None)], 0)
+        elif self._segment_count >= 2:
+            self._start_packets_probe(ffprobe_path)
+        else:
+            self._probe_frame_count(ffprobe_path)
+
+    def _start_packets_probe(self, ffprobe_path: str):
+        # 包列表随视频时长线性增长，按 csv 逐行增量解析，避免在界面线程上一次性处理整段输出
+        process = QProcess(self)
+        process.readyReadStandardOutput.connect(partial(self._on_packets_output, process))
+        process.finished.connect(partial(self._on_packets_probed, process))
+        process.errorOccurred.connect(partial(self._on_packets_error, process))
+        process.start(ffprobe_path, self._packets_probe_args())
+
+    def _on_packets_output(self, process: QProcess):
+        data = bytes(process.readAllStandardOutput()).decode("utf-8", "replace")
+        lines = (self._probe_output + data).split("\n")
+        self._probe_output = lines.pop()
+        for line in lines:
+            self._parse_probe_line(line)
+
+    def _parse_probe_line(self, line: str):
+        section, _, rest = line.strip().partition(",")
+        fields = rest.split(",")
+        if section == "packet":
+            flags = fields[1] if len(fields) > 1 else ""
+            if "D" in flags:
+                return
+            try:
+                pts_time = float(fields[0])
+            except ValueError:
+                self._probe_valid = False
+                return
+            self._packet_times.append(pts_time)
+            if flags.startswith("K"):
+                self._keyframe_times.append(pts_time)
+        elif section == "stream":
+            self._probe_stream = dict(zip(("codec_name", "field_order"), fields))
+        elif section == "format":
+            try:
+                self._probe_start_time = float(fields[0])
+            except ValueError:
+                pass
+
+    def _on_packets_error(self, process: QProcess, error: QProcess.ProcessError):
+        if error == QProcess.FailedToStart:
+            process.deleteLater()
+            self._probe_frame_count(self._find_ffprobe())
+
+    def _on_packets_probed(
+        self, process: QProcess, exit_code: int, exit_status: QProcess.ExitStatus
+    ):
+        self._on_packets_output(process)
+        self._parse_probe_line(self._probe_output)
+        process.deleteLater()
+        intervals = []
+        if exit_status == QProcess.NormalExit and exit_code == 0 and self._probe_valid:
+            self._check_stream_copy(self._probe_stream)
+            intervals = self._parse_intervals(
+                self._packet_times,
+                self._keyframe_times,
+                self._probe_start_time,
+                self._segment_count,
+            )
+        self._packet_times = array("d")
+        self._keyframe_times = array("d")
+        if not intervals:
+            self._probe_frame_count(self._find_ffprobe())
+            return
+        last = intervals[-1]
+        total_frames = -(-(last.first_frame + last.frame_count) // self._frame_stride)
+        intervals[-1] = Interval(last.start_time, last.first_frame, None)
+        self._start_segments(intervals, total_frames)
+
+    def _probe_frame_count(self, ffprobe_path: str):
+        args = [
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=codec_name,field_order,nb_frames,avg_frame_rate,duration:format=duration",
+            "-of",
+            "json",
+            self.request.video_path,
+        ]
+        self._run_probe(ffprobe_path, args, self._on_frame_count_probed)
+
+    def _on_frame_count_probed(self, output: str):
+        try:
+            info = json.loads(output)
+        except ValueError:
+            info = {}
+        stream = (info.get("streams") or [{}])[0]
+        self._check_stream_copy(stream)
+        self._duration = self._parse_duration(stream, info.get("format", {}))
+        total_frames = -(-self._parse_frame_count(stream) // self._frame_stride)
+        self._start_segments([Interval(0.0, 0, None)], total_frames)
+
+    def _check_stream_copy(self, stream: dict):
+        # MJPEG 的每个数据包本身就是一张完整 JPEG，逐帧导出且不过滤时可直接拷贝，无需解码再编码；
+        # 隔行 MJPEG 的一个数据包是上下两场 JPEG，拷贝出来只能看到半高的一场，必须解码
+        self._stream_copy = (
+            stream.get("codec_name") == "mjpeg"
+            and stream.get("field_order", "unknown") in ("progressive", "unknown")
+            and self._frame_stride == 1
+            and self.request.drop_black_threshold <= 0
+        )
+
+    def _start_segments(self, intervals: list[Interval], total_frames: int):
+        parallel = f"（{len(intervals)} 段并行）" if len(intervals) > 1 else ""
+        if self._stream_copy:
+            self.status_changed.emit(f"源视频为 MJPEG，直接导出原始帧{parallel}...")
+        elif self._hwaccel_unavailable:
+            self.status_changed.emit(f"未检测到可用的硬件解码，使用 CPU 解码{parallel}...")
+        elif parallel:
+            self.status_changed.emit(f"开始转换{parallel}...")
+
+        # 多段并行时平分 CPU，避免每个 ffmpeg 的解码和编码都按全部核心开线程
+        threads = "0" if len(intervals) == 1 else str(max(1, self._cpu_count // len(intervals)))
+        output_pattern = os.path.join(self.request.output_dir, "img_%06d.jpg")
+        cmds = [
+            cmd
+            for interval in intervals
+            if (cmd := self._build_segment_cmd(interval, output_pattern, threads))
+        ]
 
-        output_pattern = os.path.join(output_dir, "img_%05d.jpg")
+        self._total_frames = total_frames
+        self._segment_frames = [0] * len(cmds)
+        self._segment_out_times = [0] * len(cmds)
+        self._pending_output = [""] * len(cmds)
+        self._running = len(cmds)
+        for index in range(len(cmds)):
+            process = QProcess(self)
+            process.readyReadStandardOutput.connect(partial(self._on_segment_output, index))
+            process.finished.connect(partial(self._on_segment_finished, index))
+            process.errorOccurred.connect(partial(self._on_segment_error, index))
+            self._processes.append(process)
+        for process, cmd in zip(self._processes, cmds):
+            process.start(cmd[0], cmd[1:])
+
+    def _build_segment_cmd(
+        self, interval: Interval, output_pattern: str, threads: str
+    ) -> list[str] | None:
+        # 输出编号 = 该区间之前被采样保留的帧数，保证多段输出编号连续
+        frame_stride = self._frame_stride
+        start_number = -(-interval.first_frame // frame_stride)
         cmd = [
-            ffmpeg_path,
+            self.request.ffmpeg_path,
             "-hide_banner",
             "-loglevel",
             "error",
-            "-i",
-            video_path,
-            "-vsync",
-            "0",
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-threads",
+            threads,
+        ]
+        if not self._stream_copy:
+            cmd += self._hwaccel_args
+        if interval.first_frame > 0:
+            # 解码时 -ss 会精确丢弃之前的帧，略早起读可避免浮点误差丢掉关键帧本身；
+            # 流拷贝只会回退到不晚于 -ss 的关键帧，略晚一点才能恰好落在该关键帧上
+            offset = 0.0005 if self._stream_copy else -0.0005
+            cmd += ["-ss", f"{max(0.0, interval.start_time + offset):.6f}"]
+        cmd += ["-i", self.request.video_path, "-vsync", "0"]
+        if self._stream_copy:
+            # mjpeg2jpeg 为缺少 Huffman 表的 AVI MJPEG 帧补齐文件头，输出可独立打开的 JPEG
+            cmd += ["-c:v", "copy", "-bsf:v", "mjpeg2jpeg"]
+        else:
+            cmd += self._encode_args(interval.first_frame, threads)
+        if interval.frame_count is not None:
+            end_number = -(-(interval.first_frame + interval.frame_count) // frame_stride)
+            if end_number <= start_number:
+                return None
+            cmd += ["-frames:v", str(end_number - start_number)]
+        cmd += ["-start_number", str(start_number), output_pattern]
+        return cmd
+
+    def _encode_args(self, first_frame: int, threads: str) -> list[str]:
+        return [
+            *self._filter_args(first_frame),
             "-q:v",
             "2",
-            "-start_number",
-            "0",
-            output_pattern,
+            # 输出侧的 -threads 作用于 JPEG 编码器，与解码线程重叠流水执行
+            "-threads",
+            threads,
         ]
-        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr.strip() or "ffmpeg 转换失败")
 
-        frame_index = self._count_frames(output_dir)
+    def _on_segment_output(self, index: int):
+        process = self._processes[index]
+        data = bytes(process.readAllStandardOutput()).decode("utf-8", "replace")
+        lines = (self._pending_output[index] + data).split("\n")
+        self._pending_output[index] = lines.pop()
+        for line in lines:
+            key, _, value = line.strip().partition("=")
+            if key == "frame" and value.isdigit():
+                self._segment_frames[index] = int(value)
+            elif key == "out_time_us" and value.isdigit():
+                self._segment_out_times[index] = int(value)
+        self._report_progress()
+
+    def _report_progress(self):
+        if self.request.drop_black_threshold > 0:
+            # 丢弃的黑帧不计入 frame=，改按已处理到的时间位置估算；时长未知时保持不确定状态
+            if self._duration > 0:
+                done = sum(self._segment_out_times) / 1_000_000
+                self.progress = min(99, int(done * 100 / self._duration))
+            return
+        if self._total_frames <= 0:
+            return
+        self.progress = min(99, sum(self._segment_frames) * 100 // self._total_frames)
+
+    def _on_segment_finished(self, index: int, exit_code: int, exit_status: QProcess.ExitStatus):
+        if self._aborted:
+            return
+        process = self._processes[index]
+        self._on_segment_output(index)
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            stderr = bytes(process.readAllStandardError()).decode("utf-8", "replace")
+            self._abort(stderr.strip() or "ffmpeg 转换失败")
+            return
+
+        self._running -= 1
+        if self._running > 0:
+            return
+        # ffmpeg 结束时的最后一条 frame= 即为该段实际导出的帧数
+        frame_index = sum(self._segment_frames)
         if frame_index > 999_999:
-            raise RuntimeError("帧数超过 999999，已中止")
-        self.progress_changed.emit(100)
+            self.failed.emit("帧数超过 999999，已中止")
+            return
+        self.progress = 100
         self.status_changed.emit("转换完成")
         self.finished_ok.emit(frame_index)
 
-    def _count_frames(self, output_dir: str) -> int:
-        try:
-            return len(
-                [
-                    name
-                    for name in os.listdir(output_dir)
-                    if name.lower().endswith(".jpg") and name.startswith("img_")
-                ]
+    def _on_segment_error(self, index: int, error: QProcess.ProcessError):
+        if error == QProcess.FailedToStart and not self._aborted:
+            self._abort(f"ffmpeg 启动失败：{self._processes[index].errorString()}")
+
+    def _abort(self, message: str):
+        self._aborted = True
+        for process in self._processes:
+            if process.state() != QProcess.NotRunning:
+                process.kill()
+        self.failed.emit(message)
+
+    def _filter_args(self, first_frame: int = 0) -> list[str]:
+        filters = []
+        if self._frame_stride > 1:
+            # 在 ffmpeg 内按帧序号抽帧，跳过的帧不会进入 JPEG 编码
+            filters.append(f"select=not(mod(n+{first_frame}\\,{self._frame_stride}))")
+        if self.request.drop_black_threshold > 0:
+            # 平均亮度（YAVG，0-255）由 signalstats 在 ffmpeg 内计算，不高于阈值的帧被丢弃；
+            # 先转成全范围格式，否则常见的 tv 范围视频纯黑也有约 16。列出三种色度采样由 ffmpeg
+            # 按源格式挑选，与 JPEG 编码器本来就会做的转换一致，不降低色度分辨率也不多转一次
+            filters.append(
+                "format=yuvj420p|yuvj422p|yuvj444p,"
+                "signalstats,metadata=mode=select:key=lavfi.signalstats.YAVG"
+                f":value={self.request.drop_black_threshold}:function=greater"
             )
+        if not filters:
+            return []
+        return ["-vf", ",".join(filters)]
+
+    def _packets_probe_args(self) -> list[str]:
+        return [
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts_time,flags:stream=codec_name,field_order:format=start_time",
+            "-of",
+            "csv",
+            self.request.video_path,
+        ]
+
+    def _parse_intervals(
+        self, packet_times, keyframe_times, start_time: float, count: int
+    ) -> list[Interval]:
+        """按关键帧把视频切成至多 count 段时长相近的区间；无法切分时返回空列表。"""
+        if not packet_times:
+            return []
+
+        # 区间内帧数按显示时间戳顺序统计，B 帧重排后依然准确
+        times = sorted(packet_times)
+        keyframes = sorted(keyframe_times)
+        if not keyframes or keyframes[0] != times[0]:
+            return []
+        first_pts = times[0]
+        span = times[-1] - first_pts
+        boundaries = [0]
+        for segment in range(1, count):
+            target = first_pts + span * segment / count
+            keyframe = bisect_left(keyframes, target)
+            if keyframe == len(keyframes):
+                continue
+            index = bisect_left(times, keyframes[keyframe])
+            if index > boundaries[-1]:
+                boundaries.append(index)
+        if len(boundaries) < 2:
+            return []
+
+        boundaries.append(len(times))
+        return [
+            Interval(times[begin] - start_time, begin, end - begin)
+            for begin, end in zip(boundaries, boundaries[1:])
+        ]
+
+    def _parse_hwaccels(self, output: str) -> list[str]:
+        """返回 ffmpeg 编译时启用的硬件解码方式，例如 videotoolbox、cuda。"""
+        lines = [line.strip() for line in output.splitlines()]
+        return [line for line in lines if line and not line.endswith(":")]
+
+    def _parse_frame_count(self, info: dict) -> int:
+        """估算视频总帧数，仅用于进度显示；无法获取时返回 0。"""
+        try:
+            if info.get("nb_frames", "").isdigit():
+                return int(info["nb_frames"])
+            num, _, den = info.get("avg_frame_rate", "0/1").partition("/")
+            return int(float(info["duration"]) * float(num) / float(den or 1))
         except Exception:
             return 0
 
+    def _parse_duration(self, stream: dict, format_info: dict) -> float:
+        """返回视频时长（秒），流上没有时长时取容器时长；无法获取时返回 0。"""
+        for duration in (stream.get("duration"), format_info.get("duration")):
+            try:
+                return float(duration)
+            except (TypeError, ValueError):
+                continue
+        return 0.0
+
+    def _find_ffprobe(self) -> str | None:
+        ffprobe_path = os.path.join(os.path.dirname(self.request.ffmpeg_path), "ffprobe")
+        if os.path.isfile(ffprobe_path) and os.access(ffprobe_path, os.X_OK):
+            return ffprobe_path
+        return None
+
 
 class MainWindow(QWidget):
     def __init__(self):
@@ -103,7 +520,13 @@ class MainWindow(QWidget):
         self.setWindowTitle("视频转图像 + Labelme")
         self.worker = None
         self.labelme_worker = None
+        self._ffmpeg_path = None
+        self._uvx_path = None
         self._build_ui()
+        # 启动时在后台线程查找 ffmpeg/uvx，避免点击按钮时在界面线程上检查文件
+        self.tool_detect_worker = ToolDetectWorker()
+        self.tool_detect_worker.detected.connect(self.on_tools_detected)
+        self.tool_detect_worker.start()
 
     def _build_ui(self):
         layout = QVBoxLayout()
@@ -134,6 +557,25 @@ class MainWindow(QWidget):
         layout.addLayout(output_row)
 
         action_row = QHBoxLayout()
+        stride_label = QLabel("采样间隔")
+        self.frame_stride_input = QSpinBox()
+        self.frame_stride_input.setRange(1, 1000)
+        self.frame_stride_input.setValue(1)
+        self.frame_stride_input.setSuffix(" 帧")
+        self.frame_stride_input.setToolTip("每隔 N 帧导出一帧，1 表示逐帧导出")
+        action_row.addWidget(stride_label)
+        action_row.addWidget(self.frame_stride_input)
+        self.use_gpu_checkbox = QCheckBox("硬件解码")
+        self.use_gpu_checkbox.setToolTip("使用 GPU（VideoToolbox/CUDA 等）解码，不可用时自动回退到 CPU")
+        action_row.addWidget(self.use_gpu_checkbox)
+        black_label = QLabel("黑帧阈值")
+        self.drop_black_input = QSpinBox()
+        self.drop_black_input.setRange(0, 255)
+        self.drop_black_input.setValue(0)
+        self.drop_black_input.setSpecialValueText("不过滤")
+        self.drop_black_input.setToolTip("丢弃平均亮度（0-255）不高于该值的帧，0 表示不过滤")
+        action_row.addWidget(black_label)
+        action_row.addWidget(self.drop_black_input)
         self.convert_btn = QPushButton("转换")
         self.convert_btn.clicked.connect(self.start_conversion)
         self.launch_labelme_btn = QPushButton("启动 Labelme")
@@ -145,6 +587,9 @@ class MainWindow(QWidget):
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(16)
+        self.progress_timer.timeout.connect(self._poll_progress)
 
         self.status_label = QLabel("")
         layout.addWidget(self.status_label)
@@ -209,9 +654,13 @@ class MainWindow(QWidget):
             video_path=video_path,
             output_dir=output_dir,
             ffmpeg_path=ffmpeg_path,
+            frame_stride=self.frame_stride_input.value(),
+            use_gpu=self.use_gpu_checkbox.isChecked(),
+            drop_black_threshold=self.drop_black_input.value(),
         )
-        self.worker = ConvertWorker(request)
-        self.worker.progress_changed.connect(self.on_progress_changed)
+        if self.worker is not None:
+            self.worker.deleteLater()
+        self.worker = ConvertWorker(request, self)
         self.worker.status_changed.connect(self.on_status_changed)
         self.worker.finished_ok.connect(self.on_finished_ok)
         self.worker.failed.connect(self.on_failed)
@@ -219,6 +668,7 @@ class MainWindow(QWidget):
         self.convert_btn.setEnabled(False)
         self.progress_bar.setValue(0)
         self.status_label.setText("准备开始...")
+        self.progress_timer.start()
         self.worker.start()
 
     def launch_labelme(self):
@@ -235,7 +685,9 @@ class MainWindow(QWidget):
         self.labelme_worker.started_ok.connect(self.on_labelme_started)
         self.labelme_worker.start()
 
-    def on_progress_changed(self, value: int):
+    def _poll_progress(self):
+        # 按固定帧率刷新进度条，转换速度再快也不会挤占界面线程
+        value = self.worker.progress if self.worker is not None else 0
         if value < 0:
             self.progress_bar.setRange(0, 0)
         else:
@@ -246,6 +698,7 @@ class MainWindow(QWidget):
         self.status_label.setText(text)
 
     def on_finished_ok(self, count: int):
+        self.progress_timer.stop()
         self._cleanup_dot_jpgs()
         self.convert_btn.setEnabled(True)
         self.status_label.setText(f"转换完成，共 {count} 帧")
@@ -253,11 +706,16 @@ class MainWindow(QWidget):
         self.progress_bar.setValue(100)
 
     def on_failed(self, message: str):
+        self.progress_timer.stop()
         self.convert_btn.setEnabled(True)
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self._alert(message)
 
+    def on_tools_detected(self, ffmpeg_path: str, uvx_path: str):
+        self._ffmpeg_path = self._ffmpeg_path or ffmpeg_path or None
+        self._uvx_path = self._uvx_path or uvx_path or None
+
     def on_labelme_started(self):
         self.status_label.setText("Labelme 已启动")
 
@@ -289,38 +747,15 @@ class MainWindow(QWidget):
             pass
 
     def _find_uvx(self) -> str | None:
-        env_path = os.environ.get("UVX_PATH", "").strip()
-        if env_path and os.path.isfile(env_path) and os.access(env_path, os.X_OK):
-            return env_path
-
-        candidate_paths = [
-            os.path.expanduser("~/.cargo/bin/uvx"),
-            os.path.expanduser("~/.local/bin/uvx"),
-            "/usr/local/bin/uvx",
-            "/opt/homebrew/bin/uvx",
-        ]
-        for candidate in candidate_paths:
-            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
-                return candidate
-
-        return None
+        # 只缓存成功的查找结果，用户安装后重试即可找到
+        if not self._uvx_path:
+            self._uvx_path = find_uvx()
+        return self._uvx_path
 
     def _find_ffmpeg(self) -> str | None:
-        env_path = os.environ.get("FFMPEG_PATH", "").strip()
-        if env_path and os.path.isfile(env_path) and os.access(env_path, os.X_OK):
-            return env_path
-
-        candidate_paths = [
-            os.path.expanduser("~/.local/bin/ffmpeg"),
-            "/usr/local/bin/ffmpeg",
-            "/opt/homebrew/bin/ffmpeg",
-            "/usr/bin/ffmpeg",
-        ]
-        for candidate in candidate_paths:
-            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
-                return candidate
-
-        return None
+        if not self._ffmpeg_path:
+            self._ffmpeg_path = find_ffmpeg()
+        return self._ffmpeg_path
 
 
 class LabelmeWorker(QThread):
@@ -354,6 +789,13 @@ class LabelmeWorker(QThread):
             self.failed.emit(f"启动失败：{exc}")
 
 
+class ToolDetectWorker(QThread):
+    detected = Signal(str, str)
+
+    def run(self):
+        self.detected.emit(find_ffmpeg() or "", find_uvx() or "")
+
+
 def main():
     app = QApplication(sys.argv)
     window = MainWindow()